@@ -1,18 +1,22 @@
 # config/config.py
 import os
+import functools
 from dataclasses import dataclass
 from typing import Dict, Any
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Configuration class for test settings"""
     BASE_URL: str = "https://example.com"
     BROWSER: str = "chrome"  # chrome, firefox, edge, safari
     HEADLESS: bool = False
-    IMPLICIT_WAIT: int = 10
+    IMPLICIT_WAIT: int = 10  # only applied inside BaseDriver._implicit() blocks
     EXPLICIT_WAIT: int = 20
+    POLL_INTERVAL: float = 0.25  # seconds between explicit-wait polls
     PAGE_LOAD_TIMEOUT: int = 30
+    PAGE_LOAD_STRATEGY: str = "eager"  # normal, eager, none
     SCREENSHOT_ON_FAILURE: bool = True
+    PREFER_JS_CLICK: bool = False  # click via JavaScript instead of a native click
     VIDEO_RECORDING: bool = False
     LOG_LEVEL: str = "INFO"
     
@@ -36,4 +40,14 @@ class Config:
             HEADLESS=os.getenv("HEADLESS", "false").lower() == "true",
             IMPLICIT_WAIT=int(os.getenv("IMPLICIT_WAIT", str(cls.IMPLICIT_WAIT))),
             EXPLICIT_WAIT=int(os.getenv("EXPLICIT_WAIT", str(cls.EXPLICIT_WAIT))),
+            POLL_INTERVAL=float(os.getenv("POLL_INTERVAL", str(cls.POLL_INTERVAL))),
+            SCREENSHOT_ON_FAILURE=os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true",
+            PREFER_JS_CLICK=os.getenv("PREFER_JS_CLICK", "false").lower() == "true",
+            PAGE_LOAD_STRATEGY=os.getenv("PAGE_LOAD_STRATEGY", cls.PAGE_LOAD_STRATEGY).lower(),
         )
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> Config:
+    """Return the process-wide configuration, read from the environment once"""
+    return Config.from_env()
@@ -3,6 +3,13 @@ import pytest
 import logging
 import os
 from datetime import datetime
+from config.config import load_config
+from utils.base_driver import get_base_driver
+from utils.driver_factory import DriverFactory
+from pages.login_page import LoginPage
+from pages.home_page import HomePage
+
+logger = logging.getLogger(__name__)
 
 def pytest_configure(config):
     """Configure pytest"""
@@ -11,17 +18,78 @@ def pytest_configure(config):
     os.makedirs("screenshots", exist_ok=True)
     os.makedirs("logs", exist_ok=True)
     
-    # Configure logging
+    # Configure logging; the pid keeps xdist workers that start in the same
+    # second from sharing a log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(f'logs/test_log_{timestamp}.log'),
+            logging.FileHandler(f'logs/test_log_{timestamp}_{os.getpid()}.log'),
             logging.StreamHandler()
-        ]
+        ],
+        force=True
     )
 
+@pytest.fixture(scope="session")
+def driver_pool(worker_id):
+    """Per-worker pool of warm drivers (xdist workers are separate processes)"""
+    logger.info("Using driver pool for worker %s", worker_id)
+    yield DriverFactory
+    DriverFactory.shutdown()
+
+@pytest.fixture(scope="class")
+def driver(driver_pool):
+    """A pooled WebDriver shared by a test class, handed back to the pool afterwards"""
+    config = load_config()
+    driver = driver_pool.acquire(
+        browser=config.BROWSER,
+        headless=config.HEADLESS,
+        page_load_strategy=config.PAGE_LOAD_STRATEGY
+    )
+    yield driver
+    driver_pool.release(driver, origin=config.BASE_URL)
+
+@pytest.fixture
+def clean_driver(driver):
+    """The class's driver, reset after the test so the next one starts blank"""
+    driver._needs_reset = True
+    yield driver
+    DriverFactory.reset(driver, origin=load_config().BASE_URL)
+
+@pytest.fixture(scope="class")
+def base_driver(driver):
+    """BaseDriver for the class's driver"""
+    return get_base_driver(driver, load_config())
+
+@pytest.fixture(scope="class")
+def login_page(driver):
+    """Login page object, shared by the tests of a class"""
+    return LoginPage(driver, load_config())
+
+@pytest.fixture(scope="class")
+def home_page(driver):
+    """Home page object, shared by the tests of a class"""
+    return HomePage(driver, load_config())
+
+def pytest_collection_modifyitems(session, config, items):
+    """Fail the run when the same Class::test is copied into more than one module
+    
+    Only tests whose bodies compile to the same code count, so unrelated tests
+    that happen to share a name are left alone.
+    """
+    modules = {}
+    for item in items:
+        if item.cls is None:
+            continue
+        code = item.function.__code__
+        key = (f"{item.cls.__name__}::{item.name}", code.co_code, code.co_consts, code.co_names)
+        modules.setdefault(key, set()).add(item.module.__name__)
+    duplicates = {key[0]: mods for key, mods in modules.items() if len(mods) > 1}
+    if duplicates:
+        details = ", ".join(f"{name} in {sorted(mods)}" for name, mods in sorted(duplicates.items()))
+        raise pytest.UsageError(f"Duplicate tests collected: {details}")
+
 def pytest_html_report_title(report):
     """Customize HTML report title"""
     report.title = "Selenium Test Automation Report"
@@ -1,6 +1,7 @@
 # pages/base_page.py
-from utils.base_driver import BaseDriver
+from utils.base_driver import get_base_driver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,14 +12,14 @@ class BasePage:
     def __init__(self, driver, config):
         self.driver = driver
         self.config = config
-        self.base_driver = BaseDriver(driver, config)
+        self.base_driver = get_base_driver(driver, config)
         self.url = config.BASE_URL
     
     def open(self, url: str = None):
         """Open page"""
         page_url = url or self.url
-        logger.info(f"Opening URL: {page_url}")
-        self.driver.get(page_url)
+        logger.info("Opening URL: %s", page_url)
+        self.base_driver.fast_open(page_url)
         return self
     
     def get_title(self):
@@ -31,11 +32,25 @@ class BasePage:
     
     def wait_for_page_load(self, timeout: int = None):
         """Wait for page to load completely"""
+        # Check once before setting up a wait: by the time a test asks, the load event
+        # has often fired already. Right after an "eager" open it has usually not, as
+        # that returns at DOMContentLoaded with readyState still "interactive".
+        if self.driver.execute_script("return document.readyState") == "complete":
+            return
         wait_time = timeout or self.config.EXPLICIT_WAIT
-        self.base_driver.wait.until(
+        WebDriverWait(self.driver, wait_time, poll_frequency=self.config.POLL_INTERVAL).until(
             lambda driver: driver.execute_script("return document.readyState") == "complete"
         )
     
+    def snapshot(self, names):
+        """Check several of the page's locators at once
+        
+        Takes locator attribute names (e.g. ``["ERROR_MESSAGE"]``) and returns a dict
+        mapping each to ``{"present", "visible", "text"}``, fetched in one round-trip.
+        """
+        results = self.base_driver.query_many([getattr(self, name) for name in names])
+        return dict(zip(names, results))
+    
     def take_screenshot(self, name: str = None):
         """Take screenshot"""
         return self.base_driver.take_screenshot(name or self.__class__.__name__)
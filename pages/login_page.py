@@ -1,5 +1,6 @@
 from pages.base_page import BasePage
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 import logging
 logger = logging.getLogger(__name__)
 class LoginPage(BasePage):
@@ -8,7 +9,7 @@ class LoginPage(BasePage):
     # Locators
     USERNAME_INPUT = (By.ID, "username")
     PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.XPATH, "//button[@type='submit']")
+    LOGIN_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
     ERROR_MESSAGE = (By.CLASS_NAME, "error-message")
     
     def __init__(self, driver, config):
@@ -17,31 +18,50 @@ class LoginPage(BasePage):
     
     def enter_username(self, username: str):
         """Enter username"""
-        self.base_driver.send_keys_to_element(*self.USERNAME_INPUT, username)
+        self.base_driver.fast_fill(*self.USERNAME_INPUT, username)
         return self
     
     def enter_password(self, password: str):
         """Enter password"""
-        self.base_driver.send_keys_to_element(*self.PASSWORD_INPUT, password)
+        self.base_driver.fast_fill(*self.PASSWORD_INPUT, password)
         return self
     
     def click_login(self):
         """Click login button"""
-        self.base_driver.click_element(*self.LOGIN_BUTTON)
+        self.base_driver.fast_click(*self.LOGIN_BUTTON)
         return self
     
-    def login(self, username: str, password: str):
-        """Complete login process"""
-        logger.info(f"Logging in with username: {username}")
+    def login(self, username: str, password: str, fast: bool = True):
+        """Complete login process
+        
+        With ``fast`` the form is filled and submitted in a single script call;
+        pass ``fast=False`` to go field by field, e.g. while debugging a failure.
+        """
+        logger.info("Logging in with username: %s", username)
+        if fast and self.base_driver.fill_and_click(
+            [(*self.USERNAME_INPUT, username), (*self.PASSWORD_INPUT, password)],
+            self.LOGIN_BUTTON
+        ):
+            return self
         self.enter_username(username)
         self.enter_password(password)
         self.click_login()
         return self
     
     def get_error_message(self):
-        """Get error message text"""
-        return self.base_driver.get_element_text(*self.ERROR_MESSAGE)
+        """Wait for the error message and return its text"""
+        return self.base_driver.wait_for_visible(*self.ERROR_MESSAGE).text
     
-    def is_error_displayed(self):
-        """Check if error message is displayed"""
-        return self.base_driver.is_element_visible(*self.ERROR_MESSAGE)
+    def is_error_displayed(self, wait: bool = True):
+        """Check if error message is displayed
+        
+        Waits up to EXPLICIT_WAIT for it to appear; pass ``wait=False`` for a one-shot
+        check, e.g. when asserting that no error is shown.
+        """
+        if not wait:
+            return self.base_driver.is_element_visible(*self.ERROR_MESSAGE)
+        try:
+            self.base_driver.wait_for_visible(*self.ERROR_MESSAGE)
+            return True
+        except TimeoutException:
+            return False
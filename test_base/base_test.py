@@ -1,11 +1,8 @@
 # test_base/base_test.py
 import pytest
 import logging
-from config.config import Config
-from utils.driver_factory import DriverFactory
+from config.config import load_config
 from pages.base_page import BasePage
-from pages.login_page import LoginPage
-from pages.home_page import HomePage
 
 logger = logging.getLogger(__name__)
 
@@ -13,22 +10,18 @@ class BaseTest:
     """Base test class with setup and teardown"""
     
     @pytest.fixture(autouse=True)
-    def setup(self, request):
+    def setup(self, request, clean_driver, base_driver, login_page, home_page):
         """Setup method for each test"""
         # Load configuration
-        self.config = Config.from_env()
+        self.config = load_config()
         
-        # Create driver
-        self.driver = DriverFactory.create_driver(
-            browser=self.config.BROWSER,
-            headless=self.config.HEADLESS
-        )
+        # Driver and page objects live for the whole class; only browser state is reset
+        self.driver = clean_driver
+        self.base_driver = base_driver
+        self.login_page = login_page
+        self.home_page = home_page
         
-        # Initialize page objects
-        self.login_page = LoginPage(self.driver, self.config)
-        self.home_page = HomePage(self.driver, self.config)
-        
-        logger.info(f"Starting test: {request.node.name}")
+        logger.info("Starting test: %s", request.node.name)
         
         yield
         
@@ -36,8 +29,10 @@ class BaseTest:
         if self.config.SCREENSHOT_ON_FAILURE and hasattr(request.node, "rep_call") and request.node.rep_call.failed:
             self.take_screenshot(f"FAILED_{request.node.name}")
         
-        self.driver.quit()
-        logger.info(f"Finished test: {request.node.name}")
+        # clean_driver resets browser state after this; elements resolved during
+        # this test will not survive that
+        self.base_driver.clear_element_cache()
+        logger.info("Finished test: %s", request.node.name)
     
     def take_screenshot(self, name: str):
         """Take screenshot"""
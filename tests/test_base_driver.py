@@ -0,0 +1,149 @@
+from selenium.common.exceptions import (
+    InvalidSelectorException, JavascriptException, NoSuchElementException, StaleElementReferenceException,
+    TimeoutException
+)
+from selenium.webdriver.common.by import By
+import pytest
+from config.config import Config
+from utils import base_driver
+from utils.base_driver import BaseDriver
+
+
+class FakeElement:
+    """Stands in for a WebElement; raises once marked stale, like a re-rendered node"""
+
+    def __init__(self, text: str = "", displayed: bool = True):
+        self._text = text
+        self.displayed = displayed
+        self.stale = False
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return self._text
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class FakeDriver:
+    """Stands in for a WebDriver whose page is a {(by, value): element} dict"""
+
+    def __init__(self):
+        self.dom = {}
+        self.scripts = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if script is base_driver._FIND_ELEMENT_JS:
+            by, value = args
+            if value.startswith("["):
+                raise JavascriptException("SyntaxError: not a valid selector")
+            return self.dom.get((by, value))
+        if script is base_driver._QUERY_MANY_JS:
+            return [self._describe(self.dom.get(tuple(spec))) for spec in args[0]]
+        raise AssertionError("unexpected script")
+
+    def find_element(self, by, value):
+        if (by, value) not in self.dom:
+            raise NoSuchElementException()
+        return self.dom[(by, value)]
+
+    def find_elements(self, by, value):
+        return [self.dom[(by, value)]] if (by, value) in self.dom else []
+
+    @staticmethod
+    def _describe(element):
+        if element is None:
+            return {"present": False, "visible": False, "text": ""}
+        return {"present": True, "visible": element.displayed, "text": element.text if element.displayed else ""}
+
+
+@pytest.fixture
+def fake_driver():
+    return FakeDriver()
+
+
+@pytest.fixture
+def base(fake_driver, tmp_path):
+    config = Config(EXPLICIT_WAIT=1, POLL_INTERVAL=0.01, SCREENSHOT_ON_FAILURE=False,
+                    SCREENSHOTS_PATH=str(tmp_path))
+    return BaseDriver(fake_driver, config)
+
+
+def test_find_element_reuses_cached_element(base, fake_driver):
+    fake_driver.dom[(By.ID, "username")] = element = FakeElement()
+
+    assert base.find_element(By.ID, "username") is element
+    assert base.find_element(By.ID, "username") is element
+    assert len(fake_driver.scripts) == 1
+
+
+def test_element_cache_evicts_least_recently_used(base, fake_driver, monkeypatch):
+    monkeypatch.setattr(base_driver, "_ELEMENT_CACHE_SIZE", 2)
+    for name in ("a", "b", "c"):
+        fake_driver.dom[(By.ID, name)] = FakeElement(name)
+    base.find_element(By.ID, "a")
+    base.find_element(By.ID, "b")
+    base.find_element(By.ID, "a")
+    base.find_element(By.ID, "c")
+    fake_driver.scripts.clear()
+
+    base.find_element(By.ID, "a")
+    assert fake_driver.scripts == []
+    base.find_element(By.ID, "b")
+    assert len(fake_driver.scripts) == 1
+
+
+def test_stale_cached_element_is_resolved_again(base, fake_driver):
+    fake_driver.dom[(By.ID, "banner")] = old = FakeElement("old")
+    base.find_element(By.ID, "banner")
+    old.stale = True
+    fake_driver.dom[(By.ID, "banner")] = new = FakeElement("new")
+
+    assert base.get_element_text(By.ID, "banner") == "new"
+    assert base.find_element(By.ID, "banner") is new
+
+
+def test_find_element_times_out_when_element_never_appears(base):
+    with pytest.raises(TimeoutException, match="Element not found"):
+        base.find_element(By.ID, "missing", timeout=0.05)
+
+
+def test_find_element_reports_invalid_css_selector(base):
+    with pytest.raises(InvalidSelectorException):
+        base.find_element(By.CSS_SELECTOR, "[[broken")
+
+
+def test_find_element_waits_through_webdriver_for_other_strategies(base, fake_driver):
+    fake_driver.dom[(By.LINK_TEXT, "Sign in")] = element = FakeElement()
+
+    assert base.find_element(By.LINK_TEXT, "Sign in") is element
+    assert fake_driver.scripts == []
+
+
+def test_find_elements_returns_empty_list_on_timeout(base):
+    assert base.find_elements(By.CSS_SELECTOR, ".missing", timeout=0.05) == []
+
+
+def test_query_many_keeps_order_across_script_and_webdriver_lookups(base, fake_driver):
+    fake_driver.dom[(By.ID, "a")] = FakeElement("first")
+    fake_driver.dom[(By.LINK_TEXT, "b")] = FakeElement("second")
+    fake_driver.dom[(By.CSS_SELECTOR, ".c")] = FakeElement("third", displayed=False)
+
+    results = base.query_many([(By.ID, "a"), (By.LINK_TEXT, "b"), (By.CSS_SELECTOR, ".c"), (By.LINK_TEXT, "d")])
+
+    assert results == [
+        {"present": True, "visible": True, "text": "first"},
+        {"present": True, "visible": True, "text": "second"},
+        {"present": True, "visible": False, "text": ""},
+        {"present": False, "visible": False, "text": ""},
+    ]
+    assert fake_driver.scripts == [base_driver._QUERY_MANY_JS]
@@ -0,0 +1,146 @@
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from urllib3.exceptions import MaxRetryError
+import pytest
+from utils import driver_factory
+from utils.driver_factory import DriverFactory
+
+
+class FakeDriver:
+    """Stands in for a WebDriver: records the calls DriverFactory makes"""
+
+    def __init__(self, fail_reset: bool = False):
+        self.fail_reset = fail_reset
+        self.current_url = "https://example.com/login"
+        self.visited = []
+        self.quit_calls = 0
+
+    def delete_all_cookies(self):
+        if self.fail_reset:
+            raise MaxRetryError(None, "/session", "driver server is gone")
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class FakeChromeDriver(FakeDriver):
+    """FakeDriver that also records the CDP commands it is sent"""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append(cmd)
+        return {}
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Drivers made by DriverFactory.create_driver, which returns fakes"""
+    drivers = []
+
+    def create_driver(browser, headless=False, **kwargs):
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(DriverFactory, "create_driver", staticmethod(create_driver))
+    monkeypatch.setattr(DriverFactory, "_pools", {})
+    return drivers
+
+
+def test_acquire_creates_driver_when_pool_is_empty(created):
+    driver = DriverFactory.acquire("Chrome", headless=True)
+
+    assert created == [driver]
+    assert driver._pool_key == ("chrome", True)
+
+
+def test_released_driver_is_reset_and_reused(created):
+    driver = DriverFactory.acquire("chrome")
+    DriverFactory.release(driver)
+
+    assert DriverFactory.acquire("chrome") is driver
+    assert driver.visited == ["about:blank"]
+    assert driver.quit_calls == 0
+    assert len(created) == 1
+
+
+def test_release_skips_reset_right_after_one(created):
+    driver = DriverFactory.acquire("chrome")
+    DriverFactory.reset(driver)
+    DriverFactory.release(driver)
+
+    assert driver.visited == ["about:blank"]
+    DriverFactory.release(DriverFactory.acquire("chrome"))
+    assert driver.visited == ["about:blank", "about:blank"]
+
+
+def test_pools_are_keyed_by_headless(created):
+    DriverFactory.release(DriverFactory.acquire("chrome", headless=False))
+
+    assert DriverFactory.acquire("chrome", headless=True) is not created[0]
+
+
+def test_release_quits_driver_when_pool_is_full(created, monkeypatch):
+    monkeypatch.setattr(driver_factory, "DRIVER_POOL_SIZE", 1)
+    first = DriverFactory.acquire("chrome")
+    second = DriverFactory.acquire("chrome")
+    DriverFactory.release(first)
+    DriverFactory.release(second)
+
+    assert first.quit_calls == 0
+    assert second.quit_calls == 1
+
+
+def test_release_discards_driver_that_fails_to_reset(created):
+    driver = DriverFactory.acquire("chrome")
+    driver.fail_reset = True
+    DriverFactory.release(driver)
+
+    assert driver.quit_calls == 1
+    assert DriverFactory.acquire("chrome") is not driver
+
+
+def test_shutdown_quits_idle_drivers(created):
+    drivers = [DriverFactory.acquire("chrome"), DriverFactory.acquire("firefox")]
+    for driver in drivers:
+        DriverFactory.release(driver)
+    DriverFactory.shutdown()
+
+    assert [driver.quit_calls for driver in drivers] == [1, 1]
+    assert DriverFactory._pools == {}
+
+
+def test_cached_resolution_restores_browser_binary(monkeypatch):
+    monkeypatch.setattr(DriverFactory, "_driver_paths", {})
+    resolved = ChromeOptions()
+    resolved.binary_location = "/cache/chrome-for-testing/chrome"
+    DriverFactory._remember_driver_path("chrome", ChromeService("/cache/chromedriver"), resolved)
+
+    options = ChromeOptions()
+    service = DriverFactory._service("chrome", ChromeService, options)
+
+    assert service.path == "/cache/chromedriver"
+    assert options.binary_location == "/cache/chrome-for-testing/chrome"
+
+
+def test_reset_keeps_http_cache_unless_asked():
+    driver = FakeChromeDriver()
+    DriverFactory.reset(driver, origin="https://example.com")
+    assert driver.cdp_commands == ["Storage.clearDataForOrigin"]
+
+    DriverFactory.reset(driver, origin="https://example.com", clear_cache=True)
+    assert driver.cdp_commands[1:] == ["Network.clearBrowserCache", "Storage.clearDataForOrigin"]
+
+
+def test_widen_connection_pool_warns_without_pool_manager(caplog):
+    driver = FakeDriver()
+    driver.command_executor = object()
+    DriverFactory._widen_connection_pool(driver, 10)
+
+    assert "Cannot widen the driver connection pool" in caplog.text
@@ -4,10 +4,147 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException,
+    ElementClickInterceptedException, ElementNotInteractableException, InvalidSelectorException,
+    JavascriptException
+)
+from collections import OrderedDict
+from contextlib import contextmanager
+import functools
 import time
 import os
-from datetime import datetime
+
+# Resolved elements kept per BaseDriver, least recently used evicted first
+_ELEMENT_CACHE_SIZE = 128
+
+# Screenshot file names remembered to skip re-capturing within the same second
+_RECENT_SCREENSHOTS_SIZE = 16
+
+# Transient lookup races that should not end an explicit wait early
+_IGNORED_WAIT_EXCEPTIONS = (StaleElementReferenceException, NoSuchElementException)
+
+# Expected-condition factories bound once, sparing the EC module lookup on every call
+_PRESENCE = EC.presence_of_element_located
+_CLICKABLE = EC.element_to_be_clickable
+_VISIBLE = EC.visibility_of_element_located
+_INVISIBLE = EC.invisibility_of_element_located
+
+@functools.lru_cache(maxsize=256)
+def _condition(factory, by, value):
+    """Build an expected condition for a locator once and reuse it"""
+    return factory((by, value))
+
+# Sets an input's value through the native value setter so frameworks that track
+# the property (e.g. React) see the change, then fires the events a user's typing
+# would. Returns false when the element is not a text field or the value did not stick.
+_SET_VALUE_FN = """
+function setValue(el, text) {
+  if (!(el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement)) return false;
+  const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  Object.getOwnPropertyDescriptor(proto, "value").set.call(el, text);
+  el.dispatchEvent(new Event("input", {bubbles: true}));
+  el.dispatchEvent(new Event("change", {bubbles: true}));
+  return el.value === text;
+}
+"""
+
+_SET_VALUE_JS = _SET_VALUE_FN + "return setValue(arguments[0], arguments[1]);"
+
+# True when the element's box lies inside the viewport
+_IN_VIEWPORT_FN = """
+function inViewport(el) {
+  const r = el.getBoundingClientRect();
+  return r.top >= 0 && r.left >= 0 && r.bottom <= innerHeight && r.right <= innerWidth;
+}
+"""
+
+# Non-smooth scrollIntoView is synchronous, so the result is usually already final
+_SCROLL_INTO_VIEW_JS = _IN_VIEWPORT_FN + """
+arguments[0].scrollIntoView({behavior: "instant", block: "center", inline: "center"});
+return inViewport(arguments[0]);
+"""
+
+_IN_VIEWPORT_JS = _IN_VIEWPORT_FN + "return inViewport(arguments[0]);"
+
+# Locator strategies the in-page scripts below can resolve themselves
+_JS_LOCATABLE = {By.ID, By.CSS_SELECTOR, By.CLASS_NAME, By.NAME, By.TAG_NAME, By.XPATH}
+
+# Shared helpers: resolve a (by, value) locator in the page and test visibility
+_LOCATE_JS = """
+function locate(by, value) {
+  switch (by) {
+    case "id": return document.getElementById(value);
+    case "css selector": return document.querySelector(value);
+    case "class name": return document.getElementsByClassName(value)[0] || null;
+    case "name": return document.getElementsByName(value)[0] || null;
+    case "tag name": return document.getElementsByTagName(value)[0] || null;
+    case "xpath": return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return null;
+}
+function isVisible(el) {
+  return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && getComputedStyle(el).visibility !== "hidden";
+}
+"""
+
+# Resolves a list of [by, value] locators in one round-trip, returning
+# {present, visible, text} for each (text is empty for hidden elements, as in WebDriver)
+_QUERY_MANY_JS = _LOCATE_JS + """
+return arguments[0].map(([by, value]) => {
+  const el = locate(by, value);
+  const visible = el !== null && isVisible(el);
+  return {present: el !== null, visible: visible, text: visible ? el.innerText.trim() : ""};
+});
+"""
+
+# Finds and clicks an element in one round-trip; false when it is missing, hidden or disabled
+_FAST_CLICK_JS = _LOCATE_JS + """
+const el = locate(arguments[0], arguments[1]);
+if (el === null || el.disabled || !isVisible(el)) return false;
+el.click();
+return true;
+"""
+
+# Finds an input and sets its value in one round-trip; false when it is missing or rejects the value
+_FAST_FILL_JS = _LOCATE_JS + _SET_VALUE_FN + """
+const el = locate(arguments[0], arguments[1]);
+return el !== null && setValue(el, arguments[2]);
+"""
+
+# Plays a full HTML5 drag-and-drop between two elements in one round-trip,
+# sharing a single DataTransfer across the events like a real drag does
+_HTML5_DRAG_AND_DROP_JS = """
+const source = arguments[0], target = arguments[1];
+const dataTransfer = new DataTransfer();
+const fire = (el, type) => el.dispatchEvent(
+  new DragEvent(type, {bubbles: true, cancelable: true, dataTransfer: dataTransfer})
+);
+fire(source, "dragstart");
+fire(target, "dragenter");
+fire(target, "dragover");
+fire(target, "drop");
+fire(source, "dragend");
+"""
+
+# Direct DOM lookup for a [by, value] locator; the returned node comes back as a
+# WebElement. Only used for strategies whose in-page lookup matches WebDriver's.
+_FIND_ELEMENT_JS = _LOCATE_JS + "return locate(arguments[0], arguments[1]);"
+
+_FIND_BY_SCRIPT = {By.ID, By.CSS_SELECTOR}
+
+# Fills several inputs and clicks a button in one round-trip. Takes a list of
+# [by, value, text] triples and a [by, value] button; returns false without
+# clicking if any element is missing or a value does not stick.
+_FILL_AND_CLICK_JS = _LOCATE_JS + _SET_VALUE_FN + """
+const fields = arguments[0].map(f => [locate(f[0], f[1]), f[2]]);
+const button = locate(arguments[1][0], arguments[1][1]);
+if (button === null || fields.some(f => f[0] === null)) return false;
+if (!fields.every(([el, text]) => setValue(el, text))) return false;
+button.click();
+return true;
+"""
 
 class BaseDriver:
     """Base driver class with common WebDriver operations"""
@@ -15,97 +152,276 @@ class BaseDriver:
     def __init__(self, driver, config):
         self.driver = driver
         self.config = config
-        self.wait = WebDriverWait(driver, config.EXPLICIT_WAIT)
-        self.actions = ActionChains(driver)
+        self._wait_cache = {}
+        self.wait = self._get_wait(config.EXPLICIT_WAIT)
+        self._element_cache = OrderedDict()
+        self._recent_screenshots = OrderedDict()
+        self._page_domain_enabled = False
+        self._screenshots_path = os.path.abspath(config.SCREENSHOTS_PATH)
+        os.makedirs(self._screenshots_path, exist_ok=True)
         
-        # Configure timeouts
-        self.driver.implicitly_wait(config.IMPLICIT_WAIT)
+        # Configure timeouts. Implicit waits stay off: every lookup goes through
+        # an explicit wait, and mixing the two makes each poll of a missing
+        # element block for the full implicit timeout.
+        self._implicit_wait = 0
+        self.driver.implicitly_wait(self._implicit_wait)
         self.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
     
+    @property
+    def actions(self) -> ActionChains:
+        """A fresh ActionChains; a shared one would replay earlier queued actions on perform()"""
+        return ActionChains(self.driver)
+    
+    def _get_wait(self, timeout: float) -> WebDriverWait:
+        """Return a cached WebDriverWait for the given timeout"""
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = self._wait_cache[timeout] = WebDriverWait(
+                self.driver, timeout,
+                poll_frequency=self.config.POLL_INTERVAL,
+                ignored_exceptions=_IGNORED_WAIT_EXCEPTIONS
+            )
+        return wait
+    
+    def clear_element_cache(self):
+        """Forget resolved elements; they do not survive navigation or context switches"""
+        self._element_cache.clear()
+    
+    @contextmanager
+    def _implicit(self, seconds: float = None):
+        """Temporarily set the implicit wait, restoring the previous value on exit"""
+        seconds = self.config.IMPLICIT_WAIT if seconds is None else seconds
+        previous = self._implicit_wait
+        if seconds != previous:
+            self.driver.implicitly_wait(seconds)
+            self._implicit_wait = seconds
+        try:
+            yield
+        finally:
+            if seconds != previous:
+                self.driver.implicitly_wait(previous)
+                self._implicit_wait = previous
+    
     def find_element(self, by: By, value: str, timeout: int = None):
-        """Find element with explicit wait"""
+        """Find element with explicit wait, reusing a previously resolved element
+        
+        Cached elements are returned without a round-trip to check them, so one may
+        be stale if the page re-rendered it; the helpers below retry once when it is.
+        """
+        key = (by, value)
+        element = self._element_cache.get(key)
+        if element is not None:
+            self._element_cache.move_to_end(key)
+            return element
+        
         wait_time = timeout or self.config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
         
         try:
-            return wait.until(EC.presence_of_element_located((by, value)))
+            if by in _FIND_BY_SCRIPT:
+                element = self._find_by_script(by, value, wait_time)
+            else:
+                element = self._get_wait(wait_time).until(
+                    _condition(_PRESENCE, by, value)
+                )
+            self._element_cache[key] = element
+            if len(self._element_cache) > _ELEMENT_CACHE_SIZE:
+                self._element_cache.popitem(last=False)
+            return element
         except TimeoutException:
-            self.take_screenshot(f"element_not_found_{value}")
+            if self.config.SCREENSHOT_ON_FAILURE:
+                self.take_screenshot(f"element_not_found_{value}")
             raise TimeoutException(f"Element not found: {by}={value}")
     
-    def find_elements(self, by: By, value: str, timeout: int = None):
-        """Find multiple elements with explicit wait"""
-        wait_time = timeout or self.config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        
+    def _on_element(self, by: By, value: str, action, timeout: int = None):
+        """Run ``action(element)``, resolving the element afresh once if the cached one went stale"""
         try:
-            wait.until(EC.presence_of_element_located((by, value)))
-            return self.driver.find_elements(by, value)
-        except TimeoutException:
-            return []
+            return action(self.find_element(by, value, timeout))
+        except StaleElementReferenceException:
+            self._element_cache.pop((by, value), None)
+            return action(self.find_element(by, value, timeout))
+    
+    def _find_by_script(self, by: By, value: str, timeout: float):
+        """Poll the in-page lookup until it returns an element or ``timeout`` passes"""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                element = self.driver.execute_script(_FIND_ELEMENT_JS, by, value)
+            except JavascriptException as e:
+                # querySelector throws on a malformed selector; report it as WebDriver does
+                raise InvalidSelectorException(f"Invalid selector: {by}={value}") from e
+            if element is not None:
+                return element
+            if time.monotonic() >= deadline:
+                raise TimeoutException()
+            time.sleep(self.config.POLL_INTERVAL)
+    
+    def find_elements(self, by: By, value: str, timeout: int = None):
+        """Find multiple elements with explicit wait, returning [] if none appear in time"""
+        deadline = time.monotonic() + (timeout or self.config.EXPLICIT_WAIT)
+        while True:
+            elements = self.driver.find_elements(by, value)
+            if elements or time.monotonic() >= deadline:
+                return elements
+            time.sleep(self.config.POLL_INTERVAL)
     
     def click_element(self, by: By, value: str, timeout: int = None):
         """Click element with wait"""
         element = self.wait_for_clickable(by, value, timeout)
+        if self.config.PREFER_JS_CLICK:
+            self.driver.execute_script("arguments[0].click();", element)
+            return
+        try:
+            self._click(element)
+        except StaleElementReferenceException:
+            # Re-rendered between the wait and the click: resolve once more
+            self._click(self.wait_for_clickable(by, value, timeout))
+    
+    def _click(self, element):
+        """Native click, falling back to JavaScript when the element is covered or not interactable"""
         try:
             element.click()
-        except Exception:
-            # Fallback to JavaScript click
+        except (ElementClickInterceptedException, ElementNotInteractableException):
             self.driver.execute_script("arguments[0].click();", element)
     
     def send_keys_to_element(self, by: By, value: str, text: str, clear: bool = True, timeout: int = None):
         """Send keys to element"""
-        element = self.find_element(by, value, timeout)
-        if clear:
+        def type_into(element):
+            if clear:
+                element.clear()
+            element.send_keys(text)
+        self._on_element(by, value, type_into, timeout)
+    
+    def set_value_fast(self, element, text: str):
+        """Set an input's value with a single script call instead of per-key typing"""
+        if not self.driver.execute_script(_SET_VALUE_JS, element, text):
+            # Field rejected the direct value set; type it instead
             element.clear()
-        element.send_keys(text)
+            element.send_keys(text)
+    
+    def fast_click(self, by: By, value: str, timeout: int = None):
+        """Find and click element in a single script call, falling back to click_element"""
+        if by in _JS_LOCATABLE and self.driver.execute_script(_FAST_CLICK_JS, by, value):
+            return
+        self.click_element(by, value, timeout)
+    
+    def fast_fill(self, by: By, value: str, text: str, timeout: int = None):
+        """Find input and set its value in a single script call, falling back to send_keys_to_element"""
+        if by in _JS_LOCATABLE and self.driver.execute_script(_FAST_FILL_JS, by, value, text):
+            return
+        self.send_keys_to_element(by, value, text, timeout=timeout)
+    
+    def fill_and_click(self, fields, button) -> bool:
+        """Fill ``(by, value, text)`` fields and click ``(by, value)`` button in one script call
+        
+        Returns False without clicking when a locator cannot be resolved in-page, an
+        element is not there yet or a field rejects the value; callers fall back to
+        the stepwise API.
+        """
+        locators = [(by, value) for by, value, _ in fields] + [tuple(button)]
+        if any(by not in _JS_LOCATABLE for by, _ in locators):
+            return False
+        return self.driver.execute_script(
+            _FILL_AND_CLICK_JS, [list(field) for field in fields], list(button)
+        )
     
     def wait_for_clickable(self, by: By, value: str, timeout: int = None):
         """Wait for element to be clickable"""
         wait_time = timeout or self.config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        return wait.until(EC.element_to_be_clickable((by, value)))
+        wait = self._get_wait(wait_time)
+        return wait.until(_condition(_CLICKABLE, by, value))
     
     def wait_for_visible(self, by: By, value: str, timeout: int = None):
         """Wait for element to be visible"""
         wait_time = timeout or self.config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        return wait.until(EC.visibility_of_element_located((by, value)))
+        wait = self._get_wait(wait_time)
+        return wait.until(_condition(_VISIBLE, by, value))
     
     def wait_for_invisible(self, by: By, value: str, timeout: int = None):
         """Wait for element to be invisible"""
         wait_time = timeout or self.config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        return wait.until(EC.invisibility_of_element_located((by, value)))
+        wait = self._get_wait(wait_time)
+        return wait.until(_condition(_INVISIBLE, by, value))
     
     def scroll_to_element(self, element):
         """Scroll to element"""
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)  # Allow scroll to complete
+        if self.driver.execute_script(_SCROLL_INTO_VIEW_JS, element):
+            return
+        # CSS smooth scrolling (or an element larger than the viewport) can leave it
+        # out of view for a moment; give it a short grace period, then carry on
+        try:
+            WebDriverWait(self.driver, 0.3, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script(_IN_VIEWPORT_JS, element)
+            )
+        except TimeoutException:
+            pass
     
     def hover_over_element(self, by: By, value: str):
         """Hover over element"""
-        element = self.find_element(by, value)
-        self.actions.move_to_element(element).perform()
+        self._on_element(by, value, lambda element: self.actions.move_to_element(element).perform())
     
-    def drag_and_drop(self, source_by: By, source_value: str, target_by: By, target_value: str):
-        """Drag and drop operation"""
-        source = self.find_element(source_by, source_value)
-        target = self.find_element(target_by, target_value)
-        self.actions.drag_and_drop(source, target).perform()
+    def drag_and_drop(self, source_by: By, source_value: str, target_by: By, target_value: str,
+                      html5: bool = False):
+        """Drag and drop operation
+        
+        Drags with mouse actions by default; pass ``html5=True`` for native HTML5
+        drag-and-drop targets to dispatch the drag events in one script call.
+        """
+        def drag():
+            source = self.find_element(source_by, source_value)
+            target = self.find_element(target_by, target_value)
+            if html5:
+                self.driver.execute_script(_HTML5_DRAG_AND_DROP_JS, source, target)
+            else:
+                self.actions.drag_and_drop(source, target).perform()
+        try:
+            drag()
+        except StaleElementReferenceException:
+            # Either end may have been re-rendered; resolve both afresh
+            self._element_cache.pop((source_by, source_value), None)
+            self._element_cache.pop((target_by, target_value), None)
+            drag()
     
     def switch_to_frame(self, frame_reference):
         """Switch to iframe"""
+        self.clear_element_cache()
         self.driver.switch_to.frame(frame_reference)
     
     def switch_to_default_content(self):
         """Switch back to main content"""
+        self.clear_element_cache()
         self.driver.switch_to.default_content()
     
     def switch_to_window(self, window_handle):
         """Switch to window"""
+        self.clear_element_cache()
         self.driver.switch_to.window(window_handle)
     
+    def fast_open(self, url: str):
+        """Navigate to ``url`` and return as soon as the document is interactive
+        
+        Chromium drivers navigate through CDP ``Page.navigate`` and poll readyState every
+        50ms; other browsers, and the "normal" page load strategy, use ``driver.get()``.
+        With the "none" strategy it returns once navigation has started, as ``get()`` would.
+        """
+        self.clear_element_cache()
+        if not hasattr(self.driver, "execute_cdp_cmd") or self.config.PAGE_LOAD_STRATEGY == "normal":
+            self.driver.get(url)
+            return
+        # driver.get() drops back to the top-level frame; Page.navigate does not, and a
+        # selected iframe would be detached by the navigation
+        self.driver.switch_to.default_content()
+        if not self._page_domain_enabled:
+            self.driver.execute_cdp_cmd("Page.enable", {})
+            self._page_domain_enabled = True
+        result = self.driver.execute_cdp_cmd("Page.navigate", {"url": url})
+        if result.get("errorText"):
+            raise WebDriverException(f"Navigation to {url} failed: {result['errorText']}")
+        if self.config.PAGE_LOAD_STRATEGY == "none":
+            return
+        WebDriverWait(self.driver, self.config.PAGE_LOAD_TIMEOUT, poll_frequency=0.05).until(
+            lambda driver: driver.execute_script("return document.readyState") != "loading"
+        )
+    
     def get_current_url(self):
         """Get current URL"""
         return self.driver.current_url
@@ -116,14 +432,17 @@ class BaseDriver:
     
     def refresh_page(self):
         """Refresh current page"""
+        self.clear_element_cache()
         self.driver.refresh()
     
     def navigate_back(self):
         """Navigate back"""
+        self.clear_element_cache()
         self.driver.back()
     
     def navigate_forward(self):
         """Navigate forward"""
+        self.clear_element_cache()
         self.driver.forward()
     
     def execute_javascript(self, script, *args):
@@ -132,38 +451,76 @@ class BaseDriver:
     
     def take_screenshot(self, name: str = None):
         """Take screenshot"""
-        if not os.path.exists(self.config.SCREENSHOTS_PATH):
-            os.makedirs(self.config.SCREENSHOTS_PATH)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
         filename = f"{name}_{timestamp}.png" if name else f"screenshot_{timestamp}.png"
-        filepath = os.path.join(self.config.SCREENSHOTS_PATH, filename)
+        filepath = os.path.join(self._screenshots_path, filename)
         
+        # Same name within the same second: the file already holds this capture
+        if filename in self._recent_screenshots:
+            return filepath
         self.driver.save_screenshot(filepath)
+        self._recent_screenshots[filename] = filepath
+        if len(self._recent_screenshots) > _RECENT_SCREENSHOTS_SIZE:
+            self._recent_screenshots.popitem(last=False)
         return filepath
     
     def get_element_text(self, by: By, value: str, timeout: int = None):
         """Get element text"""
-        element = self.find_element(by, value, timeout)
-        return element.text
+        return self._on_element(by, value, lambda element: element.text, timeout)
     
     def get_element_attribute(self, by: By, value: str, attribute: str, timeout: int = None):
         """Get element attribute"""
-        element = self.find_element(by, value, timeout)
-        return element.get_attribute(attribute)
+        return self._on_element(by, value, lambda element: element.get_attribute(attribute), timeout)
+    
+    def query_many(self, specs):
+        """Return ``{present, visible, text}`` for each ``(by, value)`` locator
+        
+        Locators the page can resolve itself are all answered by one script call;
+        others (e.g. link text) are looked up individually through WebDriver.
+        """
+        specs = [tuple(spec) for spec in specs]
+        in_page = [list(spec) for spec in specs if spec[0] in _JS_LOCATABLE]
+        results = iter(self.driver.execute_script(_QUERY_MANY_JS, in_page) if in_page else [])
+        return [
+            next(results) if by in _JS_LOCATABLE else self._query_one(by, value)
+            for by, value in specs
+        ]
+    
+    def _query_one(self, by: By, value: str):
+        """WebDriver lookup behind query_many for locators scripts cannot resolve"""
+        with self._implicit(0):
+            elements = self.driver.find_elements(by, value)
+        if not elements:
+            return {"present": False, "visible": False, "text": ""}
+        visible = elements[0].is_displayed()
+        return {"present": True, "visible": visible, "text": elements[0].text if visible else ""}
     
     def is_element_present(self, by: By, value: str):
         """Check if element is present"""
+        if by in _JS_LOCATABLE:
+            return self.query_many([(by, value)])[0]["present"]
         try:
-            self.driver.find_element(by, value)
+            with self._implicit(0):
+                self.driver.find_element(by, value)
             return True
         except NoSuchElementException:
             return False
     
     def is_element_visible(self, by: By, value: str):
         """Check if element is visible"""
+        if by in _JS_LOCATABLE:
+            return self.query_many([(by, value)])[0]["visible"]
         try:
-            element = self.driver.find_element(by, value)
+            with self._implicit(0):
+                element = self.driver.find_element(by, value)
             return element.is_displayed()
         except NoSuchElementException:
             return False
+
+
+def get_base_driver(driver, config) -> BaseDriver:
+    """Return the BaseDriver attached to ``driver``, creating it on first use"""
+    base_driver = getattr(driver, "_base_driver", None)
+    if base_driver is None:
+        base_driver = driver._base_driver = BaseDriver(driver, config)
+    return base_driver
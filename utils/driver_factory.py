@@ -6,16 +6,174 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
 import logging
+import os
+import queue
+import sys
+import threading
 
 logger = logging.getLogger(__name__)
 
+# URL patterns blocked through CDP in Chrome: images, web fonts, media, trackers and ads
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.woff*",
+    "*.mp4",
+    "*.googletagmanager.com/*",
+    "*google-analytics*",
+    "*doubleclick*",
+]
+
+# Background features that cost CPU/memory in CI and add nothing to a test run
+CHROME_PERFORMANCE_ARGS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-breakpad",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--disable-ipc-flooding-protection",
+    "--disable-client-side-phishing-detection",
+    "--disable-component-extensions-with-background-pages",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--password-store=basic",
+    "--force-color-profile=srgb",
+    "--dns-prefetch-disable",
+]
+
+# Sockets the command executor may keep open to the driver server, so wait
+# pollers running alongside regular commands do not queue on a single connection
+HTTP_POOL_MAXSIZE = 10
+
+# Environment variables that point at a preinstalled driver binary per browser
+DRIVER_PATH_ENV_VARS = {
+    "chrome": "CHROMEDRIVER",
+    "firefox": "GECKODRIVER",
+    "edge": "EDGEDRIVER",
+}
+
+# Warm drivers kept per (browser, headless) pool; extra released drivers are quit
+DRIVER_POOL_SIZE = 4
+
 class DriverFactory:
     """Factory class for creating WebDriver instances"""
     
+    # (driver binary, browser binary) per browser, as resolved by Selenium Manager on first use
+    _driver_paths: Dict[str, Tuple[str, str]] = {}
+    _driver_paths_lock = threading.Lock()
+    
+    # Idle drivers handed out by acquire(), keyed by (browser, headless)
+    _pools: Dict[tuple, queue.Queue] = {}
+    _pools_lock = threading.Lock()
+    
+    @staticmethod
+    def acquire(browser: str, headless: bool = False, **kwargs) -> webdriver.Remote:
+        """
+        Get a WebDriver from the pool, creating one if no warm driver is idle
+        
+        Pooled drivers are shared by (browser, headless); kwargs only apply to drivers
+        created by this call. Hand the driver back with release() instead of quitting it.
+        """
+        key = (browser.lower(), headless)
+        try:
+            driver = DriverFactory._pool(key).get_nowait()
+            driver._needs_reset = True
+            logger.debug("Reusing pooled %s driver", key[0])
+            return driver
+        except queue.Empty:
+            driver = DriverFactory.create_driver(browser, headless, **kwargs)
+            driver._pool_key = key
+            return driver
+    
+    @staticmethod
+    def release(driver: webdriver.Remote, origin: Optional[str] = None):
+        """
+        Reset a driver obtained from acquire() and return it to its pool
+        
+        The reset is skipped when the driver has not been used since its last reset().
+        
+        Args:
+            driver: Driver to release
+            origin: URL whose origin storage is cleared (defaults to the current page)
+        """
+        try:
+            if getattr(driver, "_needs_reset", True):
+                DriverFactory.reset(driver, origin)
+        except Exception as e:
+            # A crashed driver server surfaces as urllib3 errors, not WebDriverException
+            logger.warning("Discarding driver that failed to reset: %s", e)
+            DriverFactory._quit(driver)
+            return
+        try:
+            DriverFactory._pool(driver._pool_key).put_nowait(driver)
+        except queue.Full:
+            DriverFactory._quit(driver)
+    
+    @staticmethod
+    def _quit(driver: webdriver.Remote):
+        """Quit a driver, logging instead of raising if it is already gone"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning("Failed to quit driver: %s", e)
+    
+    @staticmethod
+    def shutdown():
+        """Quit every idle pooled driver"""
+        with DriverFactory._pools_lock:
+            pools = list(DriverFactory._pools.values())
+            DriverFactory._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    DriverFactory._quit(pool.get_nowait())
+                except queue.Empty:
+                    break
+    
+    @staticmethod
+    def _pool(key: tuple) -> queue.Queue:
+        """Return the idle-driver queue for a (browser, headless) key"""
+        with DriverFactory._pools_lock:
+            pool = DriverFactory._pools.get(key)
+            if pool is None:
+                pool = DriverFactory._pools[key] = queue.Queue(maxsize=DRIVER_POOL_SIZE)
+            return pool
+    
+    @staticmethod
+    def reset(driver: webdriver.Remote, origin: Optional[str] = None, clear_cache: bool = False):
+        """
+        Clear cookies and origin storage, and leave the driver on about:blank
+        
+        The HTTP cache is kept by default so the next test loads static assets warm.
+        
+        Args:
+            driver: Driver to reset
+            origin: URL whose origin storage is cleared (defaults to the current page)
+            clear_cache: Also clear the browser's HTTP cache (Chromium only)
+        """
+        url = urlsplit(origin or driver.current_url)
+        driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            if clear_cache:
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            if url.scheme in ("http", "https"):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                    "origin": f"{url.scheme}://{url.netloc}",
+                    "storageTypes": "all"
+                })
+        driver.get("about:blank")
+        driver._needs_reset = False
+    
     @staticmethod
     def create_driver(browser: str, headless: bool = False, **kwargs) -> webdriver.Remote:
         """
@@ -40,6 +198,52 @@ class DriverFactory:
         else:
             raise ValueError(f"Unsupported browser: {browser}")
     
+    @staticmethod
+    def _service(browser: str, service_class, options):
+        """Build a driver service from $CHROMEDRIVER/$GECKODRIVER/$EDGEDRIVER or an earlier resolution
+        
+        An earlier resolution also restores the browser binary Selenium Manager chose
+        (e.g. a downloaded Chrome for Testing) on ``options``, unless one is already set.
+        """
+        with DriverFactory._driver_paths_lock:
+            paths = DriverFactory._driver_paths.get(browser)
+            if paths is None:
+                path = os.environ.get(DRIVER_PATH_ENV_VARS[browser])
+                if path:
+                    paths = DriverFactory._driver_paths[browser] = (path, "")
+        if paths is None:
+            return service_class()
+        driver_path, browser_path = paths
+        if browser_path and not options.binary_location:
+            options.binary_location = browser_path
+        # With an explicit path Selenium skips the Selenium Manager lookup
+        return service_class(executable_path=driver_path)
+    
+    @staticmethod
+    def _remember_driver_path(browser: str, service, options):
+        """Record the driver and browser binaries Selenium Manager resolved for ``service``"""
+        if service.path:
+            with DriverFactory._driver_paths_lock:
+                DriverFactory._driver_paths.setdefault(browser, (service.path, options.binary_location or ""))
+    
+    @staticmethod
+    def _widen_connection_pool(driver: webdriver.Remote, maxsize: int):
+        """Raise the urllib3 pool size used to talk to the driver server
+        
+        Local drivers build their RemoteConnection themselves and take no client
+        config, so this adjusts the executor's private pool manager in place.
+        """
+        pool_manager = getattr(driver.command_executor, "_conn", None)
+        if pool_manager is None or not hasattr(pool_manager, "connection_pool_kw"):
+            logger.warning(
+                "Cannot widen the driver connection pool: %s has no urllib3 pool manager at _conn",
+                type(driver.command_executor).__name__
+            )
+            return
+        pool_manager.connection_pool_kw["maxsize"] = maxsize
+        # Drop the pool created during session start; the next command opens a wider one
+        pool_manager.clear()
+    
     @staticmethod
     def _create_chrome_driver(headless: bool, **kwargs) -> webdriver.Chrome:
         """Create Chrome WebDriver with optimized options"""
@@ -48,67 +252,95 @@ class DriverFactory:
         # Performance optimizations
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-plugins")
-        options.add_argument("--disable-images")  # Optional: faster loading
+        options.add_argument("--blink-settings=imagesEnabled=false")
         options.add_argument("--window-size=1920,1080")
+        for arg in CHROME_PERFORMANCE_ARGS:
+            options.add_argument(arg)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
+        # "eager" returns from driver.get() on DOMContentLoaded instead of the full load event
+        options.page_load_strategy = kwargs.get("page_load_strategy", "eager")
         
         if headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
+            # New headless mode renders on the GPU path like headful Chrome; only
+            # Windows still needs the switch to avoid rendering glitches
+            if sys.platform == "win32":
+                options.add_argument("--disable-gpu")
         
         # Custom options from kwargs
         for arg in kwargs.get("chrome_args", []):
             options.add_argument(arg)
         
-        service = ChromeService(ChromeDriverManager().install())
-        
+        service = DriverFactory._service("chrome", ChromeService, options)
         try:
             driver = webdriver.Chrome(service=service, options=options)
+            DriverFactory._remember_driver_path("chrome", service, options)
+            blocked_urls = kwargs.get("blocked_urls", BLOCKED_URL_PATTERNS)
+            if kwargs.get("block_resources", True) and blocked_urls:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(blocked_urls)})
+            DriverFactory._widen_connection_pool(driver, kwargs.get("pool_maxsize", HTTP_POOL_MAXSIZE))
             logger.info("Chrome driver created successfully")
             return driver
         except Exception as e:
-            logger.error(f"Failed to create Chrome driver: {e}")
+            logger.error("Failed to create Chrome driver: %s", e)
             raise
     
     @staticmethod
     def _create_firefox_driver(headless: bool, **kwargs) -> webdriver.Firefox:
         """Create Firefox WebDriver"""
         options = FirefoxOptions()
+        options.page_load_strategy = kwargs.get("page_load_strategy", "eager")
         
         if headless:
             options.add_argument("--headless")
         
         options.set_preference("dom.webnotifications.enabled", False)
         options.set_preference("media.volume_scale", "0.0")
+        options.set_preference("permissions.default.image", 2)  # don't fetch images
         
-        service = FirefoxService(GeckoDriverManager().install())
-        
+        service = DriverFactory._service("firefox", FirefoxService, options)
         try:
             driver = webdriver.Firefox(service=service, options=options)
+            DriverFactory._remember_driver_path("firefox", service, options)
+            DriverFactory._widen_connection_pool(driver, kwargs.get("pool_maxsize", HTTP_POOL_MAXSIZE))
             logger.info("Firefox driver created successfully")
             return driver
         except Exception as e:
-            logger.error(f"Failed to create Firefox driver: {e}")
+            logger.error("Failed to create Firefox driver: %s", e)
             raise
     
     @staticmethod
     def _create_edge_driver(headless: bool, **kwargs) -> webdriver.Edge:
         """Create Edge WebDriver"""
         options = EdgeOptions()
+        options.page_load_strategy = kwargs.get("page_load_strategy", "eager")
         
         if headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
+            if sys.platform == "win32":
+                options.add_argument("--disable-gpu")
         
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+        })
         
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        
+        service = DriverFactory._service("edge", EdgeService, options)
         try:
             driver = webdriver.Edge(service=service, options=options)
+            DriverFactory._remember_driver_path("edge", service, options)
+            DriverFactory._widen_connection_pool(driver, kwargs.get("pool_maxsize", HTTP_POOL_MAXSIZE))
             logger.info("Edge driver created successfully")
             return driver
         except Exception as e:
-            logger.error(f"Failed to create Edge driver: {e}")
+            logger.error("Failed to create Edge driver: %s", e)
             raise